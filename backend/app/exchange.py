@@ -1,11 +1,39 @@
 from pyxt.spot import Spot
 import logging
-import ccxt
-import requests
+import ccxt.async_support as ccxt_async
+import ccxt.pro as ccxt_pro
+import aiohttp
+from aiolimiter import AsyncLimiter
 import asyncio
+import numpy as np
+import orjson
+import time
 
 logger = logging.getLogger(__name__)
 
+# Seconds to serve other-exchange prices from memory before refetching
+PRICE_CACHE_TTL = 5
+# Requests per second allowed to each REST host
+XT_RATE_LIMIT = 10
+XEGGEX_RATE_LIMIT = 10
+# Symbol configs (precision, limits) are effectively static
+SYMBOL_CONFIG_TTL = 24 * 60 * 60
+# XT accepts at most this many orders per batch request
+BATCH_ORDER_LIMIT = 100
+# Maximum number of order requests in flight at once
+ORDER_CONCURRENCY = 5
+# Xeggex market IDs rarely change; failed lookups are retried sooner
+XEGGEX_MARKET_ID_TTL = 24 * 60 * 60
+XEGGEX_MARKET_ID_MISS_TTL = 5 * 60
+# Decimal places XT accepts for AIPG order price and quantity
+PRICE_DECIMALS = 6
+QUANTITY_DECIMALS = 2
+# Websocket ticker streams; streamed prices older than this fall back to REST
+XT_WS_URL = "wss://stream.xt.com/public"
+XT_WS_PING_INTERVAL = 20
+WS_PRICE_MAX_AGE = 30
+WS_RECONNECT_DELAY = 5
+
 class Exchange:
     def __init__(self, api_key: str, secret_key: str):
         self.client = Spot(
@@ -14,33 +42,179 @@ class Exchange:
             secret_key=secret_key
         )
         # Initialize Coinex client
-        self.coinex = ccxt.coinex({
+        self.coinex = ccxt_async.coinex({
+            'enableRateLimit': True
+        })
+        self.coinex_ws = ccxt_pro.coinex({
             'enableRateLimit': True
         })
         
         # Xeggex API endpoints
         self.xeggex_base_url = "https://api.xeggex.com/api/v2"
         self.xeggex_market_id = None  # Will be fetched when needed
+        self._xeggex_market_id_ts = None  # Monotonic time of the last lookup
+
+        # Shared HTTP session, created lazily inside the running event loop
+        self._http = None
+
+        # Per-host request rate limiters
+        self._xt_limiter = AsyncLimiter(XT_RATE_LIMIT, 1)
+        self._xeggex_limiter = AsyncLimiter(XEGGEX_RATE_LIMIT, 1)
+
+        # Bounds concurrent batch order and cancel requests to stay within XT rate limits
+        self._order_sem = asyncio.Semaphore(ORDER_CONCURRENCY)
+
+        # XT symbol configs keyed by symbol: (monotonic timestamp, config)
+        self._symbol_config = {}
+
+        # Other-exchange prices keyed by symbol: (monotonic timestamp, prices)
+        self._price_cache = {}
+
+        # Last streamed prices keyed by (source, symbol): (monotonic timestamp, price)
+        self._last_prices = {}
+        self._ws_tasks = []
+
+    async def _session(self):
+        """Get the shared aiohttp session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+            )
+        return self._http
+
+    async def close(self):
+        """Release network resources held by the exchange clients"""
+        for task in self._ws_tasks:
+            task.cancel()
+        await asyncio.gather(*self._ws_tasks, return_exceptions=True)
+        self._ws_tasks = []
+        for client in (self.coinex, self.coinex_ws):
+            try:
+                await client.close()
+            except Exception as e:
+                logger.error(f"Error closing Coinex client: {str(e)}")
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+
+    def start_price_streams(self, symbol: str = "aipg_usdt"):
+        """Start background websocket ticker subscriptions for XT and Coinex"""
+        if self._ws_tasks:
+            return
+        self._ws_tasks = [
+            asyncio.create_task(self._ws_loop_xt(symbol.lower())),
+            asyncio.create_task(self._ws_loop_coinex("AIPG/USDT"))
+        ]
+
+    def _streamed_price(self, source: str, symbol: str):
+        """Return the last streamed price if it is recent enough to trust"""
+        ts, price = self._last_prices.get((source, symbol), (0, None))
+        if price is not None and time.monotonic() - ts < WS_PRICE_MAX_AGE:
+            return price
+        return None
+
+    async def _ws_ping(self, ws, sym: str):
+        """Keep the XT websocket alive and warn when the ticker stream goes quiet"""
+        subscribed_at = time.monotonic()
+        warned = False
+        while True:
+            await asyncio.sleep(XT_WS_PING_INTERVAL)
+            await ws.send_str("ping")
+            # The server drops idle connections, but a live socket can still deliver no tickers
+            ts, _ = self._last_prices.get(('xt', sym), (0, None))
+            if time.monotonic() - max(ts, subscribed_at) >= WS_PRICE_MAX_AGE:
+                if not warned:
+                    logger.warning(f"No XT ticker received for {sym} in {WS_PRICE_MAX_AGE}s, using REST prices")
+                    warned = True
+            else:
+                warned = False
+
+    async def _ws_loop_xt(self, sym: str):
+        """Track the XT ticker for a symbol over websocket, reconnecting on failure"""
+        while True:
+            try:
+                session = await self._session()
+                async with session.ws_connect(XT_WS_URL) as ws:
+                    await ws.send_str(orjson.dumps({
+                        "method": "subscribe",
+                        "params": [f"ticker@{sym}"],
+                        "id": sym
+                    }).decode())
+                    logger.info(f"Subscribed to XT ticker stream for {sym}")
+                    ping = asyncio.create_task(self._ws_ping(ws, sym))
+                    try:
+                        async for msg in ws:
+                            if msg.type != aiohttp.WSMsgType.TEXT or msg.data == "pong":
+                                continue
+                            # Skip malformed frames rather than dropping the connection
+                            try:
+                                payload = orjson.loads(msg.data)
+                                data = payload.get('data') if isinstance(payload, dict) else None
+                                if isinstance(data, dict) and data.get('s') == sym:
+                                    price = data.get('c')
+                                    if price is not None:
+                                        self._last_prices[('xt', sym)] = (time.monotonic(), float(price))
+                            except (ValueError, TypeError) as e:
+                                logger.error(f"Skipping malformed XT ticker frame: {str(e)}")
+                    finally:
+                        ping.cancel()
+                logger.error("XT ticker stream closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in XT ticker stream: {str(e)}")
+            await asyncio.sleep(WS_RECONNECT_DELAY)
+
+    async def _ws_loop_coinex(self, market: str):
+        """Track the Coinex ticker for a market over websocket, reconnecting on failure"""
+        while True:
+            try:
+                ticker = await self.coinex_ws.watch_ticker(market)
+                if ticker and ticker.get('last') is not None:
+                    self._last_prices[('coinex', market)] = (time.monotonic(), float(ticker['last']))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in Coinex ticker stream: {str(e)}")
+                await asyncio.sleep(WS_RECONNECT_DELAY)
+
+    async def _call(self, fn, *args, **kwargs):
+        """Run a rate-limited blocking pyxt client call in a worker thread"""
+        async with self._xt_limiter:
+            return await asyncio.to_thread(fn, *args, **kwargs)
 
     async def get_balance(self, asset: str = "usdt"):
         """Get balance for an asset"""
         try:
             logger.info(f"Getting balance for {asset}")
-            balance = self.client.balance(asset.lower())
+            balance = await self._call(self.client.balance, asset.lower())
             logger.info(f"Balance response: {balance}")
             return balance
         except Exception as e:
             logger.error(f"Error getting balance: {str(e)}")
             return None
 
+    def _find_ticker(self, ticker: list, sym: str):
+        """Pick the ticker entry for a lowercased symbol from a get_tickers response"""
+        # Querying with symbol= normally returns just that symbol
+        if len(ticker) == 1:
+            t = ticker[0]
+            return t if t.get('s') == sym else None
+        return next((t for t in ticker if t.get('s') == sym), None)
+
     async def get_market_info(self, symbol: str = "aipg_usdt"):
         """Get market information including price precision"""
+        sym = symbol.lower()
         try:
             logger.info(f"Fetching market info for {symbol}")
             # Get symbol config
             try:
-                symbol_config = self.client.get_symbol_config(symbol=symbol.lower())
-                logger.info(f"Symbol config response: {symbol_config}")
+                ts, symbol_config = self._symbol_config.get(sym, (0, None))
+                if not symbol_config or time.monotonic() - ts >= SYMBOL_CONFIG_TTL:
+                    symbol_config = await self._call(self.client.get_symbol_config, symbol=sym)
+                    logger.info(f"Symbol config response: {symbol_config}")
+                    if symbol_config:
+                        self._symbol_config[sym] = (time.monotonic(), symbol_config)
                 if symbol_config:
                     # Also get current price
                     try:
@@ -50,7 +224,7 @@ class Exchange:
                         price = None
 
                     return {
-                        "symbol": symbol.lower(),
+                        "symbol": sym,
                         "status": "trading",
                         "config": symbol_config,
                         "currentPrice": price
@@ -61,16 +235,18 @@ class Exchange:
             # Try to get ticker data
             try:
                 logger.info("Getting ticker data")
-                ticker = self.client.get_tickers(symbol=symbol.lower())
+                ticker = await self._call(self.client.get_tickers, symbol=sym)
                 logger.info(f"Ticker response: {ticker}")
                 if isinstance(ticker, list) and len(ticker) > 0:
-                    ticker_data = next((t for t in ticker if t.get('s') == symbol.lower()), None)
+                    ticker_data = self._find_ticker(ticker, sym)
                     if ticker_data:
+                        get = ticker_data.get
+                        p = get('p')
                         return {
-                            "symbol": symbol.lower(),
+                            "symbol": sym,
                             "status": "trading",
-                            "currentPrice": float(ticker_data['p']) if 'p' in ticker_data else None,
-                            "timestamp": ticker_data.get('t')
+                            "currentPrice": float(p) if p is not None else None,
+                            "timestamp": get('t')
                         }
 
             except Exception as e:
@@ -83,26 +259,30 @@ class Exchange:
 
     async def get_market_price(self, symbol: str = "aipg_usdt"):
         """Get current market price for a symbol"""
+        sym = symbol.lower()
+        streamed = self._streamed_price('xt', sym)
+        if streamed is not None:
+            return streamed
         try:
-            logger.info(f"Fetching market price for {symbol}")
+            logger.info("Fetching market price for %s", symbol)
             # Get ticker data
-            ticker = self.client.get_tickers(symbol=symbol.lower())
-            logger.info(f"Ticker response: {ticker}")
+            ticker = await self._call(self.client.get_tickers, symbol=sym)
+            logger.info("Ticker response: %s", ticker)
             
             if not ticker:
                 raise Exception("No ticker data received")
 
             # The response is a list of ticker objects with 's' (symbol), 't' (timestamp), 'p' (price)
             if isinstance(ticker, list) and len(ticker) > 0:
-                for t in ticker:
-                    if t.get('s') == symbol.lower() and 'p' in t:
-                        try:
-                            price = float(t['p'])
-                            logger.info(f"Found price: {price}")
-                            return price
-                        except (ValueError, TypeError) as e:
-                            logger.error(f"Error converting price to float: {e}")
-                            continue
+                t = self._find_ticker(ticker, sym)
+                p = t.get('p') if t else None
+                if p is not None:
+                    try:
+                        price = float(p)
+                        logger.info("Found price: %s", price)
+                        return price
+                    except (ValueError, TypeError) as e:
+                        logger.error(f"Error converting price to float: {e}")
                 
                 raise Exception(f"No valid price found for symbol {symbol}")
             else:
@@ -112,41 +292,73 @@ class Exchange:
             logger.error(f"Error getting market price: {str(e)}")
             raise Exception(f"Failed to get market price: {str(e)}")
 
-    async def place_grid_orders(self, symbol: str, price: float, quantity: float, side: str):
-        """Place a limit order"""
-        try:
-            logger.info(f"Placing {side} order for {symbol} at {price} with quantity {quantity}")
-            
-            # Round price and quantity to appropriate decimals
-            price = round(price, 6)  # 6 decimals for price
-            quantity = round(quantity, 2)  # 2 decimals for quantity
-            
-            logger.info(f"Rounded values: price={price}, quantity={quantity}")
-            
-            response = self.client.order(
-                symbol=symbol.lower(),
-                price=price,
-                quantity=quantity,
-                side=side.upper(),
-                type='LIMIT'
-            )
-            logger.info(f"Order response: {response}")
-            return response
-        except Exception as e:
-            logger.error(f"Error placing order: {str(e)}")
-            raise Exception(f"Failed to place {side} order: {str(e)}")
+    async def place_batch_orders(self, symbol: str, orders: list):
+        """Place limit orders given as (price, quantity, side) tuples using XT batch requests"""
+        sym = symbol.lower()
+        items = [
+            {
+                'symbol': sym,
+                'side': side.upper(),
+                'type': 'LIMIT',
+                'timeInForce': 'GTC',
+                'bizType': 'SPOT',
+                'price': price,
+                'quantity': quantity
+            }
+            for price, quantity, side in orders
+        ]
+        batches = [items[i:i + BATCH_ORDER_LIMIT] for i in range(0, len(items), BATCH_ORDER_LIMIT)]
+
+        async def submit(batch):
+            async with self._order_sem:
+                return await self._call(self.client.batch_order, batch)
+
+        logger.info("Placing %d orders for %s in %d batch(es)", len(items), sym, len(batches))
+        results = await asyncio.gather(*(submit(batch) for batch in batches), return_exceptions=True)
+        logger.info("Batch order response: %s", results)
+
+        placed = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                logger.error("Error placing batch of %d orders: %s", len(batch), result)
+                continue
+            # XT documents {batchId, items: [...]}; older pyxt releases return the items list
+            entries = (result.get('items') or []) if isinstance(result, dict) else (result or [])
+            if not isinstance(entries, list):
+                logger.error("Unexpected batch order response: %s", result)
+                continue
+            # Orders are already live at this point, so a bad entry must never abort parsing
+            for entry in entries:
+                try:
+                    if entry.get('reject') or entry.get('rejected'):
+                        index = int(entry.get('index', -1))
+                        item = batch[index] if 0 <= index < len(batch) else {}
+                        logger.error(
+                            "Order rejected: %s %s at %s: %s",
+                            item.get('side'), item.get('quantity'), item.get('price'), entry.get('reason')
+                        )
+                    else:
+                        placed.append(entry)
+                except Exception as e:
+                    logger.error("Error parsing batch order result %s: %s", entry, e)
+        return placed
 
     async def get_open_orders(self, symbol: str = "aipg_usdt"):
         """Get all open orders for a symbol"""
         try:
-            logger.info(f"Getting open orders for {symbol}")
-            orders = self.client.get_open_orders(symbol=symbol.lower())
-            logger.info(f"Open orders response: {orders}")
+            logger.info("Getting open orders for %s", symbol)
+            orders = await self._call(self.client.get_open_orders, symbol=symbol.lower())
+            logger.info("Open orders response: %s", orders)
             return orders
         except Exception as e:
             logger.error(f"Error getting open orders: {str(e)}")
             return None
 
+    async def _cancel_order(self, order_id):
+        """Cancel a single order, sharing the order concurrency limit"""
+        async with self._order_sem:
+            return await self._call(self.client.cancel_order, order_id=order_id)
+
     async def cancel_all_orders(self, symbol: str):
         """Cancel all open orders for a symbol"""
         try:
@@ -155,25 +367,48 @@ class Exchange:
             if not orders:
                 return True
 
-            for order in orders:
-                try:
-                    self.client.cancel_order(order_id=order['orderId'])
-                    logger.info(f"Cancelled order {order['orderId']}")
-                except Exception as e:
-                    logger.error(f"Error canceling order {order['orderId']}: {str(e)}")
+            order_ids = [order['orderId'] for order in orders]
+            results = await asyncio.gather(
+                *(self._cancel_order(order_id) for order_id in order_ids),
+                return_exceptions=True
+            )
+            for order_id, result in zip(order_ids, results):
+                if isinstance(result, Exception):
+                    logger.error("Error canceling order %s: %s", order_id, result)
+                else:
+                    logger.info("Cancelled order %s", order_id)
 
             return True
         except Exception as e:
             logger.error(f"Error canceling all orders: {str(e)}")
             return False
 
-    async def create_grid(self, symbol: str, positions: int, total_amount: float, min_distance: float, max_distance: float, center_price: float = None):
+    def _grid_multipliers(self, market_price: float, center_price: float = None):
+        """Pick (buy, sell) quantity multipliers for a grid, once per grid build"""
+        # When correcting a skewed price, weight quantities toward the side that pulls it back
+        if center_price and market_price > center_price:
+            # Place more sell orders to bring price down
+            logger.info("Price correction (high): Doubling sell quantities, halving buy quantities")
+            return 0.5, 2.0
+        if center_price and market_price < center_price:
+            # Place more buy orders to bring price up
+            logger.info("Price correction (low): Doubling buy quantities, halving sell quantities")
+            return 2.0, 0.5
+        logger.info("Normal grid: Using equal quantities")
+        return 1.0, 1.0
+
+    async def create_grid(self, symbol: str, positions: int, total_amount: float, min_distance: float, max_distance: float, center_price: float = None, market_price: float = None):
         """Create a grid of buy and sell orders"""
         try:
             logger.info(f"Creating grid for {symbol} with {positions} positions")
+
+            # A grid needs distinct min and max levels; reject before touching any orders
+            if positions < 2:
+                raise Exception(f"Grid needs at least 2 positions, got {positions}")
             
-            # Get current market price or use provided center price
-            market_price = await self.get_market_price(symbol)
+            # Get current market price unless the caller already fetched it
+            if market_price is None:
+                market_price = await self.get_market_price(symbol)
             if not market_price:
                 raise Exception("Failed to get current market price")
 
@@ -186,61 +421,34 @@ class Exchange:
 
             # Calculate grid parameters
             amount_per_grid = total_amount / positions
-            price_step = (max_distance - min_distance) / (positions - 1)
+            distances = np.linspace(min_distance, max_distance, positions)
 
-            logger.info(f"Grid parameters: amount_per_grid={amount_per_grid}, price_step={price_step}")
+            logger.info(f"Grid parameters: amount_per_grid={amount_per_grid}, distances={distances.tolist()}")
 
-            # Place grid orders
-            orders_placed = []
-            for i in range(positions):
-                try:
-                    distance = min_distance + (price_step * i)
-                    
-                    # Calculate buy and sell prices
-                    buy_price = current_price * (1 - distance / 100)
-                    sell_price = current_price * (1 + distance / 100)
-                    
-                    logger.info(f"Grid level {i}: distance={distance}%, buy={buy_price}, sell={sell_price}")
-                    
-                    # When correcting inflated price, prioritize sell orders
-                    if center_price and market_price > center_price:
-                        # Place more sell orders to bring price down
-                        sell_quantity = (amount_per_grid / sell_price) * 2.0  # Double quantity for sells
-                        buy_quantity = (amount_per_grid / buy_price) * 0.5   # Half quantity for buys
-                        logger.info(f"Price correction (high): Increasing sell quantity to {sell_quantity}, reducing buy quantity to {buy_quantity}")
-                    elif center_price and market_price < center_price:
-                        # Place more buy orders to bring price up
-                        sell_quantity = (amount_per_grid / sell_price) * 0.5  # Half quantity for sells
-                        buy_quantity = (amount_per_grid / buy_price) * 2.0   # Double quantity for buys
-                        logger.info(f"Price correction (low): Increasing buy quantity to {buy_quantity}, reducing sell quantity to {sell_quantity}")
-                    else:
-                        sell_quantity = amount_per_grid / sell_price
-                        buy_quantity = amount_per_grid / buy_price
-                        logger.info(f"Normal grid: Using equal quantities - buy: {buy_quantity}, sell: {sell_quantity}")
-                    
-                    # Place buy order
-                    buy_order = await self.place_grid_orders(
-                        symbol=symbol,
-                        price=buy_price,
-                        quantity=buy_quantity,
-                        side='BUY'
-                    )
-                    if buy_order:
-                        orders_placed.append(buy_order)
-                    
-                    # Place sell order
-                    sell_order = await self.place_grid_orders(
-                        symbol=symbol,
-                        price=sell_price,
-                        quantity=sell_quantity,
-                        side='SELL'
-                    )
-                    if sell_order:
-                        orders_placed.append(sell_order)
-                        
-                except Exception as e:
-                    logger.error(f"Error placing grid orders at level {i}: {str(e)}")
-                    continue
+            buy_mult, sell_mult = self._grid_multipliers(market_price, center_price)
+
+            # Calculate buy and sell prices and quantities for every level at once
+            offsets = current_price * (distances * 0.01)
+            buy_prices = current_price - offsets
+            sell_prices = current_price + offsets
+            buy_quantities = np.round((amount_per_grid * buy_mult) / buy_prices, QUANTITY_DECIMALS)
+            sell_quantities = np.round((amount_per_grid * sell_mult) / sell_prices, QUANTITY_DECIMALS)
+            buy_prices = np.round(buy_prices, PRICE_DECIMALS)
+            sell_prices = np.round(sell_prices, PRICE_DECIMALS)
+
+            # Place all grid orders in as few batch requests as possible
+            orders = []
+            for buy_price, sell_price, buy_quantity, sell_quantity in zip(
+                buy_prices.tolist(),
+                sell_prices.tolist(),
+                buy_quantities.tolist(),
+                sell_quantities.tolist()
+            ):
+                orders.append((buy_price, buy_quantity, 'BUY'))
+                orders.append((sell_price, sell_quantity, 'SELL'))
+            logger.info("Grid orders (price, quantity, side): %s", orders)
+
+            orders_placed = await self.place_batch_orders(symbol, orders)
 
             logger.info(f"Successfully placed {len(orders_placed)} orders")
             return orders_placed
@@ -251,75 +459,117 @@ class Exchange:
 
     async def get_xeggex_market_id(self):
         """Get Xeggex market ID for AIPG/USDT"""
-        if self.xeggex_market_id:
-            return self.xeggex_market_id
+        if self._xeggex_market_id_ts is not None:
+            ttl = XEGGEX_MARKET_ID_TTL if self.xeggex_market_id else XEGGEX_MARKET_ID_MISS_TTL
+            if time.monotonic() - self._xeggex_market_id_ts < ttl:
+                return self.xeggex_market_id
             
         try:
             # Get all markets
-            response = requests.get(f"{self.xeggex_base_url}/markets")
             logger.info("Fetching Xeggex markets list")
-            
-            if response.status_code == 200:
-                markets = response.json()
+            session = await self._session()
+            async with self._xeggex_limiter:
+                async with session.get(f"{self.xeggex_base_url}/markets") as response:
+                    status = response.status
+                    raw = await response.read()
+
+            if status == 200:
+                markets = orjson.loads(raw)
                 # Find AIPG/USDT market
                 for market in markets:
                     if market.get('symbol') == 'AIPG/USDT':
                         self.xeggex_market_id = market.get('id')
+                        self._xeggex_market_id_ts = time.monotonic()
                         logger.info(f"Found Xeggex market ID: {self.xeggex_market_id}")
                         return self.xeggex_market_id
                 logger.error("AIPG/USDT market not found on Xeggex")
             else:
-                logger.error(f"Failed to get Xeggex markets: {response.status_code} - {response.text}")
+                logger.error(f"Failed to get Xeggex markets: {status} - {raw.decode(errors='replace')}")
         except Exception as e:
             logger.error(f"Error getting Xeggex market ID: {str(e)}")
+        # Remember the miss so we don't refetch the whole catalog on every call
+        self.xeggex_market_id = None
+        self._xeggex_market_id_ts = time.monotonic()
         return None
 
+    async def _fetch_xeggex(self):
+        """Fetch AIPG/USDT ticker from Xeggex"""
+        prices = {}
+        try:
+            # Use direct symbol endpoint
+            session = await self._session()
+            async with self._xeggex_limiter:
+                async with session.get(f"{self.xeggex_base_url}/market/getbysymbol/AIPG%2FUSDT") as xeggex_response:
+                    xeggex_status = xeggex_response.status
+                    xeggex_raw = await xeggex_response.read()
+
+            if xeggex_status == 200:
+                xeggex_data = orjson.loads(xeggex_raw)
+                logger.info(f"Xeggex response: {xeggex_data}")
+                if 'lastPrice' in xeggex_data:
+                    try:
+                        prices['xeggex'] = float(xeggex_data['lastPrice'])
+                        # Store full response for bid/ask access
+                        prices['xeggex_data'] = xeggex_data
+                        logger.info(f"Xeggex price: {prices['xeggex']}")
+                        
+                        # Also log bid/ask for reference
+                        if 'bestBid' in xeggex_data and 'bestAsk' in xeggex_data:
+                            logger.info(f"Xeggex bid/ask: {xeggex_data['bestBid']}/{xeggex_data['bestAsk']}")
+                    except (ValueError, TypeError) as e:
+                        logger.error(f"Error converting Xeggex price: {e}")
+                else:
+                    logger.error(f"No lastPrice in Xeggex response: {xeggex_data}")
+            else:
+                logger.error(f"Xeggex API error: {xeggex_status} - {xeggex_raw.decode(errors='replace')}")
+        except Exception as e:
+            logger.error(f"Error getting Xeggex price: {str(e)}")
+        return prices
+
+    async def _fetch_coinex(self):
+        """Fetch AIPG/USDT ticker from Coinex"""
+        prices = {}
+        streamed = self._streamed_price('coinex', "AIPG/USDT")
+        if streamed is not None:
+            prices['coinex'] = streamed
+            return prices
+        try:
+            coinex_ticker = await self.coinex.fetch_ticker("AIPG/USDT")
+            if coinex_ticker and 'last' in coinex_ticker:
+                prices['coinex'] = float(coinex_ticker['last'])
+                logger.info(f"Coinex price: {prices['coinex']}")
+            else:
+                logger.error(f"Invalid Coinex response: {coinex_ticker}")
+        except Exception as e:
+            logger.error(f"Error getting Coinex price: {str(e)}")
+        return prices
+
     async def get_other_exchange_prices(self, symbol: str = "aipg_usdt"):
         """Get prices from other exchanges (Xeggex and Coinex)"""
+        sym = symbol.lower()
         try:
+            ts, cached = self._price_cache.get(sym, (0, None))
+            if cached and time.monotonic() - ts < PRICE_CACHE_TTL:
+                return cached
+
             logger.info(f"Getting prices from other exchanges for {symbol}")
             prices = {}
             
-            # Get Xeggex price
-            try:
-                # Use direct symbol endpoint
-                xeggex_response = requests.get(f"{self.xeggex_base_url}/market/getbysymbol/AIPG%2FUSDT")
-                logger.info(f"Xeggex response: {xeggex_response.text}")
-                
-                if xeggex_response.status_code == 200:
-                    xeggex_data = xeggex_response.json()
-                    if 'lastPrice' in xeggex_data:
-                        try:
-                            prices['xeggex'] = float(xeggex_data['lastPrice'])
-                            # Store full response for bid/ask access
-                            prices['xeggex_data'] = xeggex_data
-                            logger.info(f"Xeggex price: {prices['xeggex']}")
-                            
-                            # Also log bid/ask for reference
-                            if 'bestBid' in xeggex_data and 'bestAsk' in xeggex_data:
-                                logger.info(f"Xeggex bid/ask: {xeggex_data['bestBid']}/{xeggex_data['bestAsk']}")
-                        except (ValueError, TypeError) as e:
-                            logger.error(f"Error converting Xeggex price: {e}")
-                    else:
-                        logger.error(f"No lastPrice in Xeggex response: {xeggex_data}")
-                else:
-                    logger.error(f"Xeggex API error: {xeggex_response.status_code} - {xeggex_response.text}")
-            except Exception as e:
-                logger.error(f"Error getting Xeggex price: {str(e)}")
-            
-            # Get Coinex price
-            try:
-                coinex_ticker = self.coinex.fetch_ticker("AIPG/USDT")
-                if coinex_ticker and 'last' in coinex_ticker:
-                    prices['coinex'] = float(coinex_ticker['last'])
-                    logger.info(f"Coinex price: {prices['coinex']}")
-                else:
-                    logger.error(f"Invalid Coinex response: {coinex_ticker}")
-            except Exception as e:
-                logger.error(f"Error getting Coinex price: {str(e)}")
+            # Query both exchanges concurrently
+            results = await asyncio.gather(
+                self._fetch_xeggex(),
+                self._fetch_coinex(),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error getting exchange price: {str(result)}")
+                elif result:
+                    prices.update(result)
             
             if prices:
                 logger.info(f"Other exchange prices: {prices}")
+                self._price_cache[sym] = (time.monotonic(), prices)
                 return prices
             else:
                 logger.error("No prices retrieved from any exchange")
@@ -330,17 +580,22 @@ class Exchange:
             return None
 
     async def should_adjust_grid(self, symbol: str = "aipg_usdt", threshold: float = 0.02):
-        """Check if grid needs adjustment based on price difference with other exchanges"""
+        """Check if grid needs adjustment based on price difference with other exchanges
+
+        Returns (needs_adjustment, target_price, xt_price) so callers can reuse the
+        XT price instead of fetching it again.
+        """
         try:
-            # Get XT price
-            xt_price = await self.get_market_price(symbol)
+            # Get XT price and other exchange prices concurrently
+            xt_price, other_prices = await asyncio.gather(
+                self.get_market_price(symbol),
+                self.get_other_exchange_prices(symbol)
+            )
             if not xt_price:
-                return False, None
+                return False, None, None
                 
-            # Get other exchange prices
-            other_prices = await self.get_other_exchange_prices(symbol)
             if not other_prices:
-                return False, None
+                return False, None, xt_price
                 
             # Calculate average price from other exchanges
             valid_prices = []
@@ -350,7 +605,7 @@ class Exchange:
                 valid_prices.append(other_prices['coinex'])
                 
             if not valid_prices:
-                return False, None
+                return False, None, xt_price
                 
             target_price = sum(valid_prices) / len(valid_prices)
             
@@ -362,10 +617,10 @@ class Exchange:
             # Always return True and target price if XT price is significantly different
             if price_diff > threshold:
                 logger.info(f"Price correction needed - XT price is {'higher' if xt_price > target_price else 'lower'} than target")
-                return True, target_price
+                return True, target_price, xt_price
             
-            return False, None
+            return False, None, xt_price
             
         except Exception as e:
             logger.error(f"Error checking grid adjustment: {str(e)}")
-            return False, None
+            return False, None, None
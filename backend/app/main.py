@@ -113,7 +113,7 @@ async def update_grid_orders():
                 logger.info(f"Current time: {current_time}")
                 
                 # Check if price needs correction
-                needs_adjustment, target_price = await exchange.should_adjust_grid(grid_state.symbol)
+                needs_adjustment, target_price, xt_price = await exchange.should_adjust_grid(grid_state.symbol)
                 
                 if needs_adjustment:
                     logger.info(f"Price correction needed. Current orders will be adjusted.")
@@ -129,7 +129,8 @@ async def update_grid_orders():
                         total_amount=grid_state.total_amount,
                         min_distance=grid_state.min_distance,
                         max_distance=grid_state.max_distance,
-                        center_price=target_price
+                        center_price=target_price,
+                        market_price=xt_price
                     )
                     logger.info(f"Created new grid around target price: {target_price}")
                 
@@ -156,7 +157,7 @@ async def create_grid(grid_params: GridParams, background_tasks: BackgroundTasks
         await exchange.cancel_all_orders(grid_params.symbol)
         
         # First check if we need price correction
-        should_adjust, target_price = await exchange.should_adjust_grid(threshold=0.01)  # Lower threshold to 1%
+        should_adjust, target_price, xt_price = await exchange.should_adjust_grid(grid_params.symbol, threshold=0.01)  # Lower threshold to 1%
         
         if should_adjust and target_price:
             logger.info(f"Price correction needed. Using target price: {target_price}")
@@ -167,18 +168,20 @@ async def create_grid(grid_params: GridParams, background_tasks: BackgroundTasks
                 total_amount=grid_params.total_amount,
                 min_distance=grid_params.min_distance,
                 max_distance=grid_params.max_distance,
-                center_price=target_price
+                center_price=target_price,
+                market_price=xt_price
             )
             current_price = target_price
         else:
             # Use normal market price if no correction needed
-            current_price = await exchange.get_market_price(grid_params.symbol)
+            current_price = xt_price or await exchange.get_market_price(grid_params.symbol)
             orders = await exchange.create_grid(
                 symbol=grid_params.symbol,
                 positions=grid_params.positions,
                 total_amount=grid_params.total_amount,
                 min_distance=grid_params.min_distance,
-                max_distance=grid_params.max_distance
+                max_distance=grid_params.max_distance,
+                market_price=current_price
             )
         
         balance = await exchange.get_balance("usdt")
@@ -463,6 +466,16 @@ async def get_grid_status(db: Session = Depends(get_db)):
         logger.error(f"Error getting grid status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.on_event("startup")
+async def startup():
+    """Start websocket price streams"""
+    exchange.start_price_streams(DEFAULT_GRID_CONFIG["symbol"])
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close exchange client sessions"""
+    await exchange.close()
+
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "Grid Trading Bot API is running"}